@@ -6,9 +6,15 @@ CREATE TABLE IF NOT EXISTS `option` (
   `option_text` VARCHAR(255) NOT NULL,
   `option_event_id` INT NOT NULL,
   `created_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
-  PRIMARY KEY (`option_id`),
-  KEY `idx_option_event_id` (`option_event_id`),
-  CONSTRAINT `fk_option_event`
+  PRIMARY KEY (`option_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- Secondary index and FK are added separately so a seed script can bulk-load
+-- `option` between the two statements: building the index over existing rows
+-- is a single sorted pass instead of one B-tree insert per row.
+-- Run once; unlike the CREATE above, this is not safe to re-run.
+ALTER TABLE `option`
+  ADD KEY `idx_option_event_id` (`option_event_id`),
+  ADD CONSTRAINT `fk_option_event`
     FOREIGN KEY (`option_event_id`) REFERENCES `event`(`event_id`)
-    ON DELETE CASCADE
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
\ No newline at end of file
+    ON DELETE CASCADE;
\ No newline at end of file
@@ -0,0 +1,12 @@
+-- Covering index for the dashboard's "available events" count.
+--
+-- Vote.getStatsForUser counts events with end_time < now that the user did
+-- not create. With (end_time, created_byFK) MySQL range-scans the closed
+-- events on end_time and checks created_byFK from the same index entry, so
+-- the subquery never reads event rows (EXPLAIN: "Using where; Using index").
+--
+-- Not added, already covered:
+--   vote(vote_user_id, voted_at): ix_vote_user_voted
+--     (2026-10-16_vote_user_index.sql) leads with the same columns.
+--   option(option_event_id): idx_option_event_id in create_option_table.sql.
+ALTER TABLE event ADD INDEX ix_event_end_creator (end_time, created_byFK);
@@ -0,0 +1,6 @@
+-- Widen user.password for Argon2id-encoded hashes.
+-- An encoded hash ($argon2id$v=19$m=65536,t=3,p=1$<salt>$<hash>) is ~97 chars
+-- and grows if the cost parameters are raised; 255 leaves headroom.
+-- Existing bcrypt hashes stay valid and are re-hashed on the user's next login.
+
+ALTER TABLE user MODIFY password VARCHAR(255) NOT NULL;
@@ -0,0 +1,11 @@
+-- Purge spent and expired password reset tokens once a day so the table and
+-- idx_prt_hash stay small. Tokens are only ever looked up while unused and
+-- unexpired, so anything a day past expiry is dead weight.
+-- Timestamps are stored in UTC (see userModels), hence UTC_TIMESTAMP().
+-- Requires the event scheduler: SET GLOBAL event_scheduler = ON;
+
+CREATE EVENT IF NOT EXISTS ev_purge_password_reset_tokens
+  ON SCHEDULE EVERY 1 DAY
+  DO
+    DELETE FROM password_reset_token
+    WHERE expires_at < UTC_TIMESTAMP() - INTERVAL 1 DAY;
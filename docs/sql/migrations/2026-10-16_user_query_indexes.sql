@@ -0,0 +1,19 @@
+-- Indexes for the hot User lookups.
+--
+-- user.email: getUserByEmail (login, register, forgot-password) filters on
+-- email; a unique index turns the scan into a single B-tree probe and also
+-- enforces the one-account-per-email rule at the database level.
+-- Fails if duplicate emails already exist; clean those up first.
+ALTER TABLE user ADD UNIQUE INDEX ux_user_email (email);
+
+-- getAllUsers orders by created_at DESC; the index is read backwards so the
+-- admin user list no longer needs a filesort.
+ALTER TABLE user ADD INDEX ix_user_created (created_at, user_id);
+
+-- password_reset_token: verify/lock queries filter on token_hash, used_at and
+-- expires_at and then join on user_id. MySQL has no partial indexes, so the
+-- token_hash index is widened into a covering index for the whole predicate
+-- plus the join key. idx_prt_user (user_id) already exists for the FK.
+ALTER TABLE password_reset_token
+  DROP INDEX idx_prt_hash,
+  ADD INDEX idx_prt_hash (token_hash, used_at, expires_at, user_id);
@@ -0,0 +1,31 @@
+-- Denormalize each vote's event onto the vote row.
+--
+-- Votes reference an option, and the option references the event, so "one
+-- vote per user per event" could only be checked with a SELECT through
+-- `option` before every write. Storing the event on the vote lets MySQL
+-- enforce the rule with a unique key, and Vote.upsertVote casts or changes
+-- a vote in a single INSERT ... ON DUPLICATE KEY UPDATE.
+-- Options never move between events, so the copy cannot drift.
+
+ALTER TABLE vote ADD COLUMN vote_event_id INT NULL AFTER vote_option_id;
+
+UPDATE vote v
+JOIN `option` o ON o.option_id = v.vote_option_id
+SET v.vote_event_id = o.option_event_id;
+
+-- Drop any duplicate votes from before the rule was enforced (keeps each
+-- user's newest vote per event) so the unique key can be built
+DELETE v FROM vote v
+JOIN vote newer
+  ON newer.vote_user_id = v.vote_user_id
+ AND newer.vote_event_id = v.vote_event_id
+ AND (newer.voted_at > v.voted_at
+      OR (newer.voted_at = v.voted_at AND newer.vote_id > v.vote_id));
+
+ALTER TABLE vote
+  MODIFY vote_event_id INT NOT NULL,
+  ADD UNIQUE KEY ux_vote_user_event (vote_user_id, vote_event_id),
+  ADD CONSTRAINT fk_vote_event
+    FOREIGN KEY (vote_event_id)
+    REFERENCES event (event_id)
+    ON DELETE CASCADE;
@@ -0,0 +1,33 @@
+-- Repoint vote.vote_option_id at `option` with a single in-place ALTER.
+--
+-- Same end state as 2025-11-11_fix_vote_fk.sql, for legacy databases that
+-- have not run it yet (FK still points to `choices`). Databases that already
+-- ran that file need nothing from this one. Run one or the other, not both.
+--
+-- That file drops and re-adds fk_vote_option1 in two ALTERs. Here both happen
+-- in one ALTER, and with foreign_key_checks off InnoDB applies it in place as
+-- a metadata change (no table copy, concurrent DML allowed).
+
+-- Inspect current FK
+-- SELECT kcu.constraint_name, kcu.referenced_table_name
+-- FROM information_schema.key_column_usage kcu
+-- WHERE kcu.table_schema=DATABASE() AND kcu.table_name='vote' AND kcu.column_name='vote_option_id' AND kcu.referenced_table_name IS NOT NULL;
+
+-- Check for votes whose option does not exist; must return 0 before running,
+-- because with foreign_key_checks off existing rows are not validated
+-- SELECT COUNT(*) FROM vote v
+-- LEFT JOIN `option` o ON o.option_id = v.vote_option_id
+-- WHERE o.option_id IS NULL;
+
+SET foreign_key_checks = 0;
+ALTER TABLE vote
+  DROP FOREIGN KEY fk_vote_option1,
+  ADD CONSTRAINT fk_vote_option1
+    FOREIGN KEY (vote_option_id)
+    REFERENCES `option` (option_id)
+    ON DELETE CASCADE,
+  ALGORITHM = INPLACE, LOCK = NONE;
+SET foreign_key_checks = 1;
+
+-- If the server rejects reusing the constraint name within one statement
+-- (older MySQL versions), run 2025-11-11_fix_vote_fk.sql instead.
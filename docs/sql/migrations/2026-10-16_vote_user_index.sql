@@ -0,0 +1,21 @@
+-- Composite index for the per-user vote reads.
+--
+-- Vote.getRecentForUser filters on vote_user_id and orders by voted_at DESC;
+-- with (vote_user_id, voted_at) it reads the newest entries of one index
+-- range (scanned backwards for the ORDER BY, no filesort) and stops at LIMIT.
+-- getStatsForUser's COUNT(*) / MAX(voted_at) for one user is answered from
+-- the same range without touching the rows.
+--
+-- No third column: getRecentForUser needs both vote_option_id and
+-- vote_event_id for its joins, so adding one of them would still not make
+-- it index-only, and the handful of rows it returns are cheap to look up.
+-- The (vote_user_id, vote_event_id) unique key already serves the single-vote
+-- reads and deletes (getSelectedOptionID, deleteVote, the upsert).
+--
+-- Not added, already covered:
+--   option(option_event_id, option_id): idx_option_event_id on
+--     option_event_id already carries the option_id primary key (InnoDB
+--     appends the PK to every secondary index).
+--   vote(vote_option_id): indexed by the fk_vote_option1 foreign key, which
+--     tallyVotesForEvent's LEFT JOIN uses.
+ALTER TABLE vote ADD INDEX ix_vote_user_voted (vote_user_id, voted_at);
@@ -2,11 +2,11 @@
 CREATE TABLE IF NOT EXISTS password_reset_token (
   id INT AUTO_INCREMENT PRIMARY KEY,
   user_id INT NOT NULL,
-  token_hash VARCHAR(128) NOT NULL,
+  token_hash BINARY(32) NOT NULL,       -- raw SHA-256 digest of the emailed token
   expires_at DATETIME NOT NULL,
   used_at DATETIME NULL,
   created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
   INDEX idx_prt_user (user_id),
-  INDEX idx_prt_hash (token_hash),
+  INDEX idx_prt_hash (token_hash, used_at, expires_at, user_id),  -- covers verify/lock lookups
   CONSTRAINT fk_prt_user FOREIGN KEY (user_id) REFERENCES user(user_id) ON DELETE CASCADE
 );
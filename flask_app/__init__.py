@@ -1,4 +1,8 @@
 import os
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from flask import Flask, render_template
 from dotenv import load_dotenv
 from flask_mail import Mail
@@ -22,6 +26,24 @@ app.config['MAIL_DEFAULT_SENDER'] = os.environ.get('MAIL_DEFAULT_SENDER', app.co
 # Initialize Flask-Mail
 mail = Mail(app)
 
+# Queries in one request share a pooled DB connection; give it back at teardown
+from flask_app.config.mysqlconnection import release_request_conn
+app.teardown_appcontext(release_request_conn)
+
+# App loggers (flask_app.*) only enqueue records; a background listener thread
+# does the stderr write, so request threads never block on log I/O
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('[%(levelname)s] %(name)s: %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+_app_logger = logging.getLogger(__name__)
+_app_logger.addHandler(QueueHandler(_log_queue))
+_app_logger.setLevel(logging.INFO)
+_app_logger.propagate = False
+
 
 @app.errorhandler(404)
 def page_not_found(e):
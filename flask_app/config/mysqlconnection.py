@@ -1,6 +1,11 @@
 import pymysql.cursors
 import os
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from urllib.parse import urlparse
+from dbutils.pooled_db import PooledDB
+from flask import g, has_app_context
 
 def get_db_config():
     """Parse database configuration from environment variable or use defaults."""
@@ -36,28 +41,99 @@ def get_db_config():
 
 DB_CONFIG = get_db_config()
 
+_pool = None
+_pool_lock = threading.Lock()
+
+@lru_cache(maxsize=256)
+def _query_kind(query):
+    """
+    Classify a statement as 'select', 'insert' or 'other'. Models pass the
+    same module-level SQL constants on every call, so the strip/lower work
+    runs once per distinct statement instead of once per query.
+    """
+    query_type = query.lstrip()[:6].lower()
+    if query_type == "select":
+        return "select"
+    if query_type == "insert":
+        return "insert"
+    return "other"
+
+def get_pool():
+    """
+    Return the process-wide connection pool, creating it on first use so
+    importing this module never opens a socket.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # DB_POOL_SIZE caps open connections (callers wait for a free
+                # one rather than exceeding it); DB_POOL_MIN are opened up front.
+                # ping=1 checks a connection each time it leaves the pool and
+                # transparently reconnects if the server dropped it
+                pool_size = int(os.environ.get('DB_POOL_SIZE', 16))
+                pool_min = min(int(os.environ.get('DB_POOL_MIN', 2)), pool_size)
+                _pool = PooledDB(creator=pymysql, mincached=pool_min,
+                                 maxcached=pool_size, maxconnections=pool_size,
+                                 blocking=True, ping=1, **DB_CONFIG)
+    return _pool
+
+@contextmanager
+def get_conn():
+    """
+    Borrow a connection from the pool for the duration of a with-block.
+    close() on a pooled connection hands it back instead of disconnecting.
+
+    Inside a Flask app context the first query of the request checks out a
+    connection and parks it on `g`; later queries in the same request reuse
+    it (one checkout and one ping per request, not per query) and
+    release_request_conn hands it back at teardown.
+    """
+    if has_app_context():
+        connection = g.get('_db_conn')
+        if connection is None:
+            connection = g._db_conn = get_pool().connection()
+        yield connection
+        return
+    connection = get_pool().connection()
+    try:
+        yield connection
+    finally:
+        connection.close()
+
+def release_request_conn(exc=None):
+    """
+    Return the request's pooled connection, if it took one. Registered
+    with app.teardown_appcontext.
+    """
+    connection = g.pop('_db_conn', None)
+    if connection is not None:
+        connection.close()
+
+
 class MySQLConnection:
     def __init__(self, db=None):
-        config = DB_CONFIG.copy()
-        self.connection = pymysql.connect(**config)
+        # Queries borrow a pooled connection (see get_conn) instead of
+        # opening a new socket (TLS + auth) on every call.
+        pass
 
     def query_db(self, query, data=None):
-        with self.connection.cursor() as cursor:
+        with get_conn() as connection, connection.cursor() as cursor:
             try:
-                query_type = query.strip().lower() 
+                query_type = _query_kind(query)
                 executable = cursor.execute(query, data)
 
-                if query_type.startswith("select"):
+                if query_type == "select":
                     result = cursor.fetchall()
                     return result
 
-                elif query_type.startswith("insert"):
-                    self.connection.commit()
+                elif query_type == "insert":
+                    connection.commit()
                     new_id = cursor.lastrowid
                     return new_id
 
                 else:
-                    self.connection.commit()
+                    connection.commit()
                     return True
 
             except Exception as e:
@@ -66,7 +142,73 @@ class MySQLConnection:
             finally:
                 pass 
 
+    def query_db_as(self, row_factory, query, data=None):
+        """
+        Run a SELECT on a plain tuple cursor and build each result with
+        row_factory(*row), skipping the per-row dict the default DictCursor
+        allocates. The SELECT's column order must match row_factory's
+        positional parameters.
+        Returns a list of row_factory results, or False on error.
+        """
+        with get_conn() as connection, connection.cursor(pymysql.cursors.Cursor) as cursor:
+            try:
+                cursor.execute(query, data)
+                return [row_factory(*row) for row in cursor.fetchall()]
+            except Exception as e:
+                print("Database error:", e)
+                return False
+
+    def query_scalar(self, query, data=None):
+        """
+        Run a single-column SELECT on a plain tuple cursor and return the
+        first row's value directly, with no row dict built.
+        Returns the value, None if no row matched, or False on error
+        (check with `is False`).
+        """
+        with get_conn() as connection, connection.cursor(pymysql.cursors.Cursor) as cursor:
+            try:
+                cursor.execute(query, data)
+                row = cursor.fetchone()
+                return row[0] if row else None
+            except Exception as e:
+                print("Database error:", e)
+                return False
+
+    def query_db_rowcount(self, query, data=None):
+        """
+        Run an UPDATE/DELETE and report how many rows it changed, for callers
+        that need to know whether a conditional write actually matched.
+        Returns the affected row count, or False on error.
+        """
+        with get_conn() as connection, connection.cursor() as cursor:
+            try:
+                affected = cursor.execute(query, data)
+                connection.commit()
+                return affected
+            except Exception as e:
+                print("Database error:", e)
+                return False
+
+    def query_db_many(self, query, seq_of_data):
+        """
+        Run one INSERT for every parameter set in seq_of_data. The driver's
+        executemany rewrites a plain INSERT ... VALUES (...) into a single
+        multi-row INSERT, so the whole batch is one round trip.
+        Returns the id of the first inserted row, or False on error.
+        """
+        with get_conn() as connection, connection.cursor() as cursor:
+            try:
+                cursor.executemany(query, seq_of_data)
+                connection.commit()
+                return cursor.lastrowid
+            except Exception as e:
+                print("Database error:", e)
+                return False
+
+
+@lru_cache(maxsize=4)
 def connectToMySQL(db=None):
+    # Cached per schema name so callers share one cheap proxy object
     return MySQLConnection(db)
 
 
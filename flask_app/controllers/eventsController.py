@@ -251,9 +251,10 @@ def createEventRoute():
                 seen.add(c)
                 ordered_unique.append(c)
         try:
-            for cand in ordered_unique:
-                opt_id = Option.create({'option_text': cand, 'option_event_id': new_event_id})
-                print(f"[CREATE EVENT] Created option id={opt_id} text='{cand}' for event {new_event_id}")
+            first_id = Option.createMany({'option_texts': ordered_unique, 'option_event_id': new_event_id})
+            if first_id is False:
+                raise RuntimeError("bulk option insert failed")
+            print(f"[CREATE EVENT] Created {len(ordered_unique)} options (first id={first_id}) for event {new_event_id}")
         except Exception as e:
             print(f"[CREATE EVENT] Exception creating options: {e}")
             import traceback
@@ -341,10 +342,11 @@ def singleEvent(event_id):
     except Exception:
         recs = []
 
-    # compute statuses for recommendations
+    # compute statuses for recommendations (one clock read for the batch)
+    now = get_now_pacific()
     for r in recs:
         try:
-            r.status = compute_status(r.start_time, r.end_time)
+            r.status = compute_status(r.start_time, r.end_time, now)
         except Exception:
             r.status = 'Unknown'
     
@@ -392,9 +394,7 @@ def singleEvent(event_id):
     selected_option_id = None
     try:
         if cur_user and not is_event_creator:  # Only check votes for non-creators
-            existing = Vote.getByUserAndEvent({'user_id': cur_user.user_id, 'event_id': event_id})
-            if existing:
-                selected_option_id = existing.vote_option_id
+            selected_option_id = Vote.getSelectedOptionID({'user_id': cur_user.user_id, 'event_id': event_id})
     except Exception:
         selected_option_id = None
 
@@ -438,29 +438,28 @@ def singleEvent(event_id):
 @app.route('/users/list')
 def usersList():
     """
-    Return a JSON list of users. Requires login.
-    Used by the single event page to show a modal with all users (creator-only button).
+    Return a JSON page of users. Requires login.
+    Used by the single event page's user list modal (creator-only button),
+    which loads one page on open and the next on "Load more".
+
+    Query params:
+        - limit (int): Page size, 1-500 (default 50)
+        - cursor (str): next_cursor value from the previous page
+
+    The response's next_cursor is None once the last page has been returned.
     """
     redirect_url = require_login()
     if redirect_url:
         return redirect(redirect_url)
 
+    limit = min(max(request.args.get('limit', 50, type=int), 1), 500)
+    cursor = request.args.get('cursor')
+
     try:
-        rows = User.getAllUsers() or []
-        # Return JSON-friendly structure (avoid exposing passwords)
-        users = []
-        for r in rows:
-            users.append({
-                'user_id': r.get('user_id'),
-                'first_name': r.get('first_name'),
-                'last_name': r.get('last_name'),
-                'email': r.get('email'),
-                'phone': r.get('phone'),
-                'created_at': r.get('created_at'),
-                'isAdmin': r.get('isAdmin')
-            })
+        # UserRow objects carry no password and serialize as-is
+        users, next_cursor = User.getAllUsers(limit=limit, before=cursor)
         from flask import jsonify
-        return jsonify({'ok': True, 'users': users})
+        return jsonify({'ok': True, 'users': users, 'next_cursor': next_cursor})
     except Exception as e:
         print(f"[USERS LIST] Error fetching users: {e}")
         from flask import jsonify
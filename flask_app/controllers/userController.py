@@ -46,7 +46,7 @@ Model Dependencies:
     - Vote: Retrieve user voting statistics and history
 
 Security Features:
-    - Passwords hashed with bcrypt before storage
+    - Passwords hashed with Argon2id before storage (legacy bcrypt upgraded on login)
     - Password reset tokens with expiration
     - Session-based authentication
     - Generic messages to prevent email enumeration attacks
@@ -56,17 +56,20 @@ from flask import request, flash, url_for, redirect, session, render_template, j
 from flask_app import app
 from flask_app.models.eventsModels import Events
 from flask_app.models.userModels import User
-from flask_bcrypt import Bcrypt
 from flask_app.utils.helpers import require_login, get_user_session_data, get_current_user
 from flask_app.utils.validators import format_phone, validate_all_registration_fields, validate_email, validate_password, validate_phone, validate_name
 from flask_app.models.voteModels import Vote
 from flask import current_app
 from flask_app.utils.mailer import send_contact_email
 import json, os
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Initialize bcrypt for pw hashing
-bcrypt = Bcrypt(app)
+log = logging.getLogger(__name__)
+
+# SMTP submits run here so reset requests don't wait on the mail server
+_EMAIL_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mail")
 
 # =============================================================================
 # HELPER FUNCTIONS - Internal utilities for controller routes
@@ -132,6 +135,29 @@ def send_email(to_address, subject, body):
     recipients = [to_address]
     send_contact_email(subject, body, recipients)
 
+def _send_reset_email(to_address, subject, body, reset_url):
+    """
+    Send a password reset email on an _EMAIL_POOL worker thread.
+
+    Flask-Mail needs an application context, so one is pushed for the send.
+    Failures are logged here because no request is waiting on the result.
+
+    Args:
+        to_address (str): Recipient email address
+        subject (str): Email subject line
+        body (str): Email body content
+        reset_url (str): Reset link, logged only in debug mode if the send fails
+    """
+    with app.app_context():
+        try:
+            send_email(to_address, subject, body)
+        except Exception as e:
+            # The link is a live reset credential: only expose it when debugging
+            if app.debug:
+                log.warning("[DEV][PASSWORD RESET] Email send failed: %s; reset link for %s: %s", e, to_address, reset_url)
+            else:
+                log.warning("[PASSWORD RESET] Email send failed for %s: %s", to_address, e)
+
 # Base path for JSON data files (about.json, credits.json)
 _DATA_BASE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'static', 'data')
 
@@ -333,7 +359,7 @@ def register():
         1. Get form data
         2. Validate all fields using centralized validators
         3. Check for existing email (prevent duplicates)
-        4. Hash password with bcrypt
+        4. Hash password with Argon2id
         5. Create user record in database
         6. Log user in automatically (set session)
     
@@ -352,8 +378,7 @@ def register():
     errors = validate_all_registration_fields(first_name, last_name, email, password, phone)
 
     # 3. Check if email already exists (custom validation)
-    existing_user = User.getUserByEmail({'email': email})
-    if existing_user:
+    if User.emailExists(email):
         errors.append("An account with this email already exists. Please try logging in instead.")
     
     # If there are any errors, show them and redirect back
@@ -365,8 +390,8 @@ def register():
     # Format phone number consistently
     formatted_phone = format_phone(phone)
     
-    # 4. Hash pw with bcrypt
-    pw_hash = bcrypt.generate_password_hash(password)
+    # 4. Hash pw with Argon2id
+    pw_hash = User.hashPassword(password)
     
     data = {
         'first_name': first_name,
@@ -399,8 +424,9 @@ def login():
         1. Extract and sanitize credentials
         2. Validate both fields are provided
         3. Look up user by email
-        4. Verify password with bcrypt
-        5. Set session variables on success
+        4. Verify password (Argon2id, or legacy bcrypt)
+        5. Upgrade legacy or outdated hashes to current Argon2id parameters
+        6. Set session variables on success
 
     Redirects:
         - /login: On validation failure or invalid credentials
@@ -418,12 +444,17 @@ def login():
     # 3. Check user credentials
     user = User.getUserByEmail({'email': email})
     
-    # 4. Verify pw with bcrypt
-    if not user or not bcrypt.check_password_hash(user.password, password):
+    # 4. Verify pw (unknown emails still pay for a hash check, so a miss
+    #    takes as long as a wrong password)
+    if not User.verifyPassword(user.password if user else None, password) or not user:
         flash("Invalid email or password. Please check your credentials and try again.")
         return redirect("/login")
+
+    # 5. Re-hash while we have the plaintext if the stored hash is outdated
+    if User.passwordNeedsRehash(user.password):
+        User.updatePassword({'user_id': user.user_id, 'password': User.hashPassword(password)})
     
-    # 5. Login successful, set session variables
+    # 6. Login successful, set session variables
     session['user_id'] = user.user_id
     session['first_name'] = user.first_name
     return redirect(url_for('eventList'))
@@ -463,7 +494,7 @@ def forgot_password_request():
         2. Check throttle (60 second cooldown per session)
         3. Create reset token (even if email doesn't exist - security)
         4. Build reset URL with token
-        5. Attempt to send email (log fallback for dev viz)
+        5. Queue email on a background worker (log fallback for dev viz)
         6. Show generic success message (prevents email enumeration)
   
     Security Notes:
@@ -502,20 +533,19 @@ def forgot_password_request():
         mail_pass = current_app.config.get('MAIL_PASSWORD') or current_app.config.get('MAIL_PASSWORD')
         
         # 5. Only attempt to send if mail credentials appear configured
+        #    (sent in the background so the response doesn't wait on SMTP)
         if reset_url and mail_user and mail_pass:
-            try:
-                send_email(email, "Password Reset Request", f"Click the link below to reset your password:\n{reset_url}\n\nIf you did not request this, you can safely ignore this email.")
-            except Exception as e:
-                # TODO- Remove Fallback before turn-in: log link for developer visibility
-                print(f"[DEV][PASSWORD RESET] Email send failed: {e}; reset link for {email}: {reset_url}")
-        else:
-            # Dev fallback when mail not configured
-            if reset_url:
-                # TODO- Remove Fallback before turn-in
-                print(f"[DEV][PASSWORD RESET] Mail config missing; reset link for {email}: {reset_url}")
+            _EMAIL_POOL.submit(_send_reset_email, email, "Password Reset Request", f"Click the link below to reset your password:\n{reset_url}\n\nIf you did not request this, you can safely ignore this email.", reset_url)
+        elif reset_url:
+            # Dev fallback when mail not configured; the link is only logged
+            # in debug mode since anyone reading it can reset the password
+            if app.debug:
+                log.warning("[DEV][PASSWORD RESET] Mail config missing; reset link for %s: %s", email, reset_url)
+            else:
+                log.warning("[PASSWORD RESET] Mail config missing; reset email for %s not sent", email)
     except Exception as e:
         # Broad catch in case url_for/external building fails unexpectedly
-        print(f"[DEV][PASSWORD RESET] Unexpected failure preparing reset email: {e}")
+        log.warning("[DEV][PASSWORD RESET] Unexpected failure preparing reset email", exc_info=e)
 
     # 6. Show success message
     flash("If an account with that email exists, a reset link has been sent.", "success")
@@ -568,8 +598,8 @@ def reset_password_submit():
         4. Validate password strength
         5. Re-verify token (prevent race conditions)
         6. Check new password differs from current
-        7. Hash and update password
-        8. Consume (invalidate) token
+        7. Hash and update password, consuming the token in the same
+           UPDATE (one joined statement, so both change or neither does)
 
     Redirects:
         - referrer or /: On validation errors
@@ -601,7 +631,9 @@ def reset_password_submit():
         return redirect(request.referrer or '/')
 
     # 5. Verify token again to prevent reuse and race conditions
-    info = User.verifyPasswordResetToken(token)
+    #    (hash it once; the digest is reused for the final update)
+    token_hash = User.hashResetToken(token)
+    info = User.verifyPasswordResetToken(token_hash)
     if not info:
         print(f"[RESET] Token verification failed for token: {token}")
         flash("The reset link is invalid or has expired.", "error")
@@ -609,7 +641,7 @@ def reset_password_submit():
 
     # 6. Disallow reusing current password
     try:
-        if bcrypt.check_password_hash(info['password'], new_password):
+        if User.verifyPassword(info['password'], new_password):
             print(f"[RESET] New password matches current password for user_id={info.get('user_id')}")
             flash("New password cannot be the same as your current password.", "error")
             return redirect(request.referrer or '/')
@@ -617,17 +649,14 @@ def reset_password_submit():
         print(f"[RESET] Error checking existing password hash: {e}")
         pass
 
-    # 7. Hash and update pw
-    pw_hash = bcrypt.generate_password_hash(new_password)
-    ok = User.updatePassword({'user_id': info['user_id'], 'password': pw_hash})
+    # 7. Hash pw, then update it and consume the token atomically
+    pw_hash = User.hashPassword(new_password)
+    ok = User.completeReset(token_hash, pw_hash)
     if not ok:
-        print(f"[RESET] User.updatePassword returned falsy for user_id={info.get('user_id')}")
+        print(f"[RESET] User.completeReset returned falsy for user_id={info.get('user_id')}")
         flash("Failed to update password. Please try again.", "error")
         return redirect('/')
 
-    # 8. Consume token
-    User.consumePasswordResetToken(token)
-
     flash("Password successfully updated. Please log in.", "success")
     return redirect('/')
 
@@ -703,9 +732,18 @@ def update_profile():
         flash("Failed to update profile. Please try again.", "error")
         print(f"Profile update error: {e}")
     """
+    # Emails are unique (ux_user_email), so taking another account's address
+    # would fail in the UPDATE; catch it first for a clear message
+    if data['email'] != (user.email or '').lower() and User.emailExists(data['email']):
+        flash("An account with this email already exists.", "error")
+        return redirect("/profile")
+
     try:
-        User.updateProfile(data)  # assume success unless exception thrown
-        flash("Profile updated successfully!", "success")
+        # False if the UPDATE failed (e.g. the email was taken in the meantime)
+        if User.updateProfile(data) is False:
+            flash("Failed to update profile. Please try again.", "error")
+        else:
+            flash("Profile updated successfully!", "success")
     except Exception as e:
         flash("Failed to update profile. Please try again.", "error")
         print(f"Profile update error: {e}")
@@ -751,7 +789,7 @@ def change_password():
         return redirect("/profile")
     
     # 5. Verify current password
-    if not bcrypt.check_password_hash(user.password, current_password):
+    if not User.verifyPassword(user.password, current_password):
         flash("Current password is incorrect", "error")
         return redirect("/profile")
     
@@ -767,13 +805,13 @@ def change_password():
         return redirect("/profile")
 
     # 8. Disallow using the same password
-    if bcrypt.check_password_hash(user.password, new_password):
+    if User.verifyPassword(user.password, new_password):
         flash("New password cannot be the same as your current password.", "error")
         return redirect("/profile")
     
     # 9. Hash and Update password
     try:
-        pw_hash = bcrypt.generate_password_hash(new_password)
+        pw_hash = User.hashPassword(new_password)
         data = {
             'user_id': user.user_id,
             'password': pw_hash
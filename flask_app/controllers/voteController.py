@@ -12,9 +12,8 @@ Routes:
     - POST /vote/delete  : Retract (delete) an existing vote
 
 Model Dependencies:
-    - Vote: Core voting operations (castVote, changeVote, deleteVote, getByUserAndEvent)
+    - Vote: Core voting operations (upsertVote, deleteVote)
     - Events: Event retrieval and ownership checking (getOne, isCreatedBy)
-    - Option: Validates option belongs to event (getByEventId)
     - compute_status: Determines if event is Open/Waiting/Closed
 
 Business Rules Enforced:
@@ -28,7 +27,6 @@ Business Rules Enforced:
 
 from flask import request, redirect, flash
 from flask_app import app
-from flask_app.models.optionModels import Option
 from flask_app.models.voteModels import Vote
 from flask_app.models.eventsModels import Events, compute_status
 from flask_app.utils.helpers import require_login, require_voter, get_current_user
@@ -51,7 +49,7 @@ def cast_vote():
         6. Verify user is not the event creator
         7. Validate selected option belongs to event
         8. Check if user already voted (if yes, update; if no, create new)
-        9. Cast/Update vote
+        9. Cast/Update vote (steps 7-9 are one guarded upsert)
 
     Redirects:
         - /eventList: On auth failure or missing data
@@ -102,39 +100,26 @@ def cast_vote():
         flash("Event creators cannot vote on their own events.", "error")
         return redirect(f"/event/{event_id}")
 
-    # 7. Extra safety: ensure the option belongs to this event
-    try:
-        valid_options = Option.getByEventId({'event_id': event_id})
-        valid_ids = {o.option_id for o in valid_options}
-        if option_id not in valid_ids:
-            flash("Selected option is not valid for this event.", "error")
-            return redirect(f"/event/{event_id}")
-    except Exception:
-        # If validation fails unexpectedly, continue without blocking
-        pass
-
-    # 8. Check if user has already voted in this event, if they have update their vote
-    existing = Vote.getByUserAndEvent({
+    # 7-9. Cast the vote, or update it if the user already voted in this
+    #      event. One upsert: it only writes if the option belongs to this
+    #      event and the event is still open, and affected rows say which
+    #      happened
+    affected = Vote.upsertVote({
         'user_id': user.user_id,
-        'event_id': event_id
+        'event_id': event_id,
+        'option_id': option_id
     })
-    
-    # 9. Cast/Update Vote
-    if existing:
-        # Update vote
-        Vote.changeVote({
-            'user_id': user.user_id,
-            'event_id': event_id,
-            'new_option_id': option_id
-        })
-        flash("Your vote was updated.", "success")
-    else:
-        # Cast new vote
-        Vote.castVote({
-            'vote_user_id': user.user_id, 
-            'vote_option_id': option_id
-        })
+    if affected is False:
+        flash("Could not record your vote. Please try again.", "error")
+    elif affected == 0:
+        # The guard blocked the write (option not in this event, or the event
+        # closed since the check above) or nothing changed (same option
+        # re-submitted within the same second), so don't claim a cause
+        flash("Your vote could not be recorded.", "error")
+    elif affected == 1:
         flash("Your vote has been submitted.", "success")
+    else:
+        flash("Your vote was updated.", "success")
     return redirect(f"/event/{event_id}")
 
 # =============================================================================
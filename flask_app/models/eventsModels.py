@@ -35,6 +35,7 @@ from datetime import datetime, timezone, timedelta
 # =============================================================================
 
 db = "mydb"
+_mysql = connectToMySQL(db)     # Cached connector, resolved once at import
 
 # Pacific Standard Time offset from UTC (UTC-8)
 # This doesn't handle DST, but keeps things simple. 
@@ -95,7 +96,7 @@ def parse_datetime(value):
     return None                                 # No format matched, Unable to parse
 
 
-def compute_status(start_raw, end_raw):
+def compute_status(start_raw, end_raw, now=None):
     """
     Compute event status: Waiting, Open, Closed, or Unknown.
         - 'Waiting': Current time is before start_time (event hasn't started)
@@ -106,6 +107,9 @@ def compute_status(start_raw, end_raw):
     Args:
         start_raw: Event start time (string or datetime, in Pacific)
         end_raw: Event end time (string or datetime, in Pacific)
+        now: Optional naive Pacific "current time". Loops over many events
+             read the clock once and pass it here, so every row is judged
+             against the same instant
         
     Returns:
         str: 'Waiting', 'Open', 'Closed', or 'Unknown'
@@ -117,7 +121,8 @@ def compute_status(start_raw, end_raw):
         return 'Unknown'
     
     # Get current time in Pacific (naive) for comparison with DB values
-    now = get_now_pacific()
+    if now is None:
+        now = get_now_pacific()
     
     # Simple comparisons - all times are naive Pacific
     if start_dt and end_dt:                     # Both times present
@@ -137,6 +142,77 @@ def compute_status(start_raw, end_raw):
     return 'Unknown'                            # Fallback, should not reach here  
 
 
+# =============================================================================
+# SQL STATEMENTS - Built once at import and shared by every call
+# =============================================================================
+
+_Q_CREATE_EVENT = """
+INSERT INTO event (title, description, start_time, end_time, created_byFK, created_at, status)
+VALUES (%(title)s, %(description)s, %(start_time)s, %(end_time)s, %(created_byFK)s, NOW(), %(status)s);
+"""
+
+_Q_EDIT_EVENT = """
+UPDATE event
+SET title       = %(title)s,
+    description = %(description)s,
+    start_time  = %(start_time)s,
+    end_time    = %(end_time)s
+WHERE event_id  = %(event_id)s;
+"""
+
+_Q_DELETE_EVENT = """
+DELETE FROM event
+WHERE event_id = %(event_id)s;
+"""
+
+_Q_ALL_WITH_CREATORS = """
+SELECT
+    e.*,
+    u.first_name AS creator_first_name,
+    u.last_name AS creator_last_name,
+    CASE
+        WHEN %(now)s < e.start_time THEN 'Waiting'
+        WHEN %(now)s >= e.end_time THEN 'Closed'
+        ELSE 'Open'
+    END AS computed_status
+FROM event e
+LEFT JOIN user u ON e.created_byFK = u.user_id
+ORDER BY
+    FIELD(
+        CASE
+            WHEN %(now)s < e.start_time THEN 'Waiting'
+            WHEN %(now)s >= e.end_time THEN 'Closed'
+            ELSE 'Open'
+        END,
+        'Open', 'Waiting', 'Closed'
+    ),
+    e.start_time ASC;
+"""
+
+_Q_GET_ONE = """
+SELECT e.*, u.first_name, u.last_name
+FROM event e
+LEFT JOIN user u ON e.created_byFK = u.user_id
+WHERE e.event_id = %(event_id)s;
+"""
+
+_Q_RECOMMENDATIONS = """
+SELECT * FROM event
+WHERE event_id != %(event_id)s
+  AND start_time IS NOT NULL
+ORDER BY start_time ASC
+LIMIT 3;
+"""
+
+_Q_UPCOMING = "SELECT * FROM event WHERE start_time > %(now)s ORDER BY start_time ASC;"
+
+_Q_UPCOMING_LIMIT = """
+SELECT * FROM event WHERE start_time > %(now)s
+ORDER BY start_time ASC
+LIMIT %(limit)s;
+"""
+
+
 # =============================================================================
 # EVENTS MODEL CLASS
 # =============================================================================
@@ -182,11 +258,7 @@ class Events:
         Returns:
             int: event_id of the newly created event, or False if the insert failed.
         """
-        query = '''
-        INSERT INTO event (title, description, start_time, end_time, created_byFK, created_at, status)
-        VALUES (%(title)s, %(description)s, %(start_time)s, %(end_time)s, %(created_byFK)s, NOW(), %(status)s);
-        '''
-        return connectToMySQL(db).query_db(query, data)
+        return _mysql.query_db(_Q_CREATE_EVENT, data)
 
     @classmethod
     def editEvent(cls, data):
@@ -205,15 +277,7 @@ class Events:
             The status field is not updated here because it should be
             computed dynamically based on current time vs start/end times.
         """
-        query = '''
-        UPDATE event
-        SET title       = %(title)s,
-            description = %(description)s,
-            start_time  = %(start_time)s,
-            end_time    = %(end_time)s
-        WHERE event_id  = %(event_id)s;
-        '''
-        return connectToMySQL(db).query_db(query, data)
+        return _mysql.query_db(_Q_EDIT_EVENT, data)
 
     @classmethod
     def deleteEvent(cls, data):
@@ -230,11 +294,7 @@ class Events:
         Returns:
             bool: True if deletion was successful, False otherwise.
         """
-        query = '''
-        DELETE FROM event
-        WHERE event_id = %(event_id)s;
-        '''
-        return connectToMySQL(db).query_db(query, data)
+        return _mysql.query_db(_Q_DELETE_EVENT, data)
 
     # =========================================================================
     # READ OPERATIONS - QUERY METHODS
@@ -259,30 +319,7 @@ class Events:
         """
         now = get_now_pacific()             # Current time in Pacific (naive)
         
-        query = """
-        SELECT
-            e.*,
-            u.first_name AS creator_first_name,
-            u.last_name AS creator_last_name,
-            CASE
-                WHEN %(now)s < e.start_time THEN 'Waiting'
-                WHEN %(now)s >= e.end_time THEN 'Closed'
-                ELSE 'Open'
-            END AS computed_status
-        FROM event e
-        LEFT JOIN user u ON e.created_byFK = u.user_id
-        ORDER BY
-            FIELD(
-                CASE
-                    WHEN %(now)s < e.start_time THEN 'Waiting'
-                    WHEN %(now)s >= e.end_time THEN 'Closed'
-                    ELSE 'Open'
-                END,
-                'Open', 'Waiting', 'Closed'
-            ),
-            e.start_time ASC;
-        """
-        result = connectToMySQL(db).query_db(query, {'now': now})
+        result = _mysql.query_db(_Q_ALL_WITH_CREATORS, {'now': now})
         
         # Transform DB rows into Events objects with extra attributes
         events = []
@@ -313,13 +350,7 @@ class Events:
         """
         
         # Join event with user to get creator info
-        query = """
-        SELECT e.*, u.first_name, u.last_name
-        FROM event e
-        LEFT JOIN user u ON e.created_byFK = u.user_id
-        WHERE e.event_id = %(event_id)s;
-        """
-        result = connectToMySQL(db).query_db(query, data)
+        result = _mysql.query_db(_Q_GET_ONE, data)
         if not result:
             return None
         
@@ -344,14 +375,7 @@ class Events:
             list[Events]: List of up to 3 Events objects, sorted by start_time.
                           Returns empty list if no other events exist.
         """
-        query = """
-        SELECT * FROM event
-        WHERE event_id != %(event_id)s
-          AND start_time IS NOT NULL
-        ORDER BY start_time ASC
-        LIMIT 3;
-        """
-        result = connectToMySQL(db).query_db(query, {'event_id': data.get('event_id')})
+        result = _mysql.query_db(_Q_RECOMMENDATIONS, {'event_id': data.get('event_id')})
         return [cls(row) for row in result] if result else []
 
     @classmethod
@@ -371,11 +395,10 @@ class Events:
         """
         now = get_now_pacific()
         
-        query = "SELECT * FROM event WHERE start_time > %(now)s ORDER BY start_time ASC"
         if limit:
-            query += f" LIMIT {limit}"
-        query += ";"
-        result = connectToMySQL(db).query_db(query, {'now': now})
+            result = _mysql.query_db(_Q_UPCOMING_LIMIT, {'now': now, 'limit': int(limit)})
+        else:
+            result = _mysql.query_db(_Q_UPCOMING, {'now': now})
         # return list of Events objects or empty list
         return [cls(row) for row in result] if result else []       
 
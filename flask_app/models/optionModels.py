@@ -25,6 +25,29 @@ VoteSmartt Rules:
 from flask_app.config.mysqlconnection import connectToMySQL
 
 db = "mydb"
+_mysql = connectToMySQL(db)     # Cached connector, resolved once at import
+
+# =============================================================================
+# SQL STATEMENTS - Built once at import and shared by every call
+# =============================================================================
+
+_Q_CREATE_OPTION = """
+INSERT INTO `option` (option_text, option_event_id)
+VALUES (%(option_text)s, %(option_event_id)s);
+"""
+
+_Q_OPTIONS_BY_EVENT = "SELECT * FROM `option` WHERE option_event_id = %(event_id)s;"
+
+_Q_UPDATE_OPTION = """
+UPDATE `option`
+SET option_text = %(option_text)s
+WHERE option_id = %(option_id)s;
+"""
+
+_Q_DELETE_OPTION = "DELETE FROM `option` WHERE option_id = %(option_id)s;"
+
+_Q_DELETE_OPTIONS_BY_EVENT = "DELETE FROM `option` WHERE option_event_id = %(event_id)s;"
+
 
 class Option:
     """
@@ -59,11 +82,34 @@ class Option:
         Returns:
             int: The option_id of the newly created option, or False on failure
         """
-        query = '''
-        INSERT INTO `option` (option_text, option_event_id)
-        VALUES (%(option_text)s, %(option_event_id)s);
-        '''
-        return connectToMySQL(db).query_db(query, data)
+        return _mysql.query_db(_Q_CREATE_OPTION, data)
+
+    @classmethod
+    def createMany(cls, data):
+        """
+        Insert all of an event's options in one round trip, instead of one
+        per candidate: executemany turns _Q_CREATE_OPTION into a single
+        multi-row INSERT. Used when creating a new event.
+
+        Args:
+            data (dict): Dictionary containing:
+                         - 'option_event_id' (int): ID of parent event
+                         - 'option_texts' (list[str]): Display text for
+                           each option, in insertion order
+
+        Returns:
+            int: The option_id of the first inserted option (the rest follow
+                 consecutively), None if there was nothing to insert,
+                 or False on failure
+        """
+        texts = data['option_texts']
+        if not texts:
+            return None
+        event_id = data['option_event_id']
+        return _mysql.query_db_many(
+            _Q_CREATE_OPTION,
+            [{'option_text': text, 'option_event_id': event_id} for text in texts],
+        )
     
     # =========================================================================
     # READ OPERATIONS
@@ -82,8 +128,7 @@ class Option:
             list[Option]: List of Option objects for the event.
                           Returns empty list if no options exist.
         """
-        query = "SELECT * FROM `option` WHERE option_event_id = %(event_id)s;"
-        results = connectToMySQL(db).query_db(query, data)
+        results = _mysql.query_db(_Q_OPTIONS_BY_EVENT, data)
         return [cls(row) for row in results]
     
     # =========================================================================
@@ -105,12 +150,7 @@ class Option:
         Returns:
             bool: True if update was successful, False otherwise.
         """
-        query = """
-        UPDATE `option` 
-        SET option_text = %(option_text)s
-        WHERE option_id = %(option_id)s;
-        """
-        return connectToMySQL(db).query_db(query, data)
+        return _mysql.query_db(_Q_UPDATE_OPTION, data)
     
     # =========================================================================
     # DELETE OPERATIONS
@@ -130,8 +170,7 @@ class Option:
             This will cascade delete any votes associated with this option
             due to the ON DELETE CASCADE foreign key constraint.
         """
-        query = "DELETE FROM `option` WHERE option_id = %(option_id)s;"
-        return connectToMySQL(db).query_db(query, data)    
+        return _mysql.query_db(_Q_DELETE_OPTION, data)    
 
     @classmethod
     def deleteByEventId(cls, data):
@@ -143,6 +182,5 @@ class Option:
         Returns:
             bool|int: Result of the delete query (driver-specific). True/number of rows deleted on success.
         """
-        query = "DELETE FROM `option` WHERE option_event_id = %(event_id)s;"
-        return connectToMySQL(db).query_db(query, data)
+        return _mysql.query_db(_Q_DELETE_OPTIONS_BY_EVENT, data)
     
\ No newline at end of file
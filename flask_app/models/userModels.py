@@ -13,7 +13,7 @@ Columns:
     - first_name (varchar): User's first name
     - last_name (varchar): User's last name
     - email (varchar): Unique email address for login
-    - password (varchar): Bcrypt-hashed password
+    - password (varchar(255)): Argon2id-encoded password hash
     - phone (varchar): Contact phone number
     - created_at (datetime): Account creation timestamp
     - isAdmin (tinyint): Role flag (0=Voter, 1=Admin)
@@ -23,70 +23,224 @@ Class Relationships:
     - User 1--* Vote: One user can cast many votes (across different events)
 
 Security Considerations:
-    - Passwords stored as bcrypt hashes (hashing done in controller)
-    - Password reset tokens are SHA-256 hashed before storage
-    - Reset tokens expire after configurable TTL (default 30 minutes)
+    - Passwords stored as Argon2id hashes (User.hashPassword); legacy bcrypt
+      hashes still verify and are upgraded on the user's next login
+    - Password reset tokens are SHA-256 hashed before storage (raw 32-byte
+      digest in a BINARY(32) column)
+    - Reset tokens expire after configurable TTL (default 30 minutes); all
+      token timestamps are written and compared in UTC (UTC_TIMESTAMP())
     - Email existence not revealed during password reset (security by obscurity)
 '''
 
 from flask_app.config.mysqlconnection import connectToMySQL
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import datetime
+from operator import itemgetter
+import base64
+import os
+import binascii
 import secrets
 import hashlib
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
 
 db = "mydb"
+_mysql = connectToMySQL(db)     # Cached connector, resolved once at import
+
+# Argon2id, OWASP-recommended cost by default (3 passes, 64 MiB, 1 lane).
+# Tunable per host via the environment; hashes made with other parameters
+# are upgraded on the user's next login (see passwordNeedsRehash).
+_password_hasher = PasswordHasher(
+    time_cost=int(os.environ.get('ARGON2_TIME_COST', 3)),
+    memory_cost=int(os.environ.get('ARGON2_MEMORY_KIB', 64 * 1024)),
+    parallelism=int(os.environ.get('ARGON2_PARALLELISM', 1)),
+)
+
+# Hash of a random throwaway secret, checked when a login names an unknown
+# email so that a miss costs the same Argon2 work as a real verify.
+_DUMMY_HASH = _password_hasher.hash(secrets.token_hex(16))
+
+# Pulls the fixed User columns out of a row dict in one C-level call
+_user_columns = itemgetter('user_id', 'first_name', 'last_name', 'email',
+                           'password', 'phone', 'created_at')
+
+# =============================================================================
+# SQL STATEMENTS - Built once at import and shared by every call
+# =============================================================================
+
+_Q_INSERT_USER = """
+INSERT INTO user
+    (first_name, last_name, email, password, phone, created_at)
+VALUES
+    (%(first_name)s, %(last_name)s, %(email)s, %(password)s, %(phone)s, NOW());
+"""
+
+# Only the columns User.__init__ reads; email is unique (ux_user_email)
+_Q_GET_USER_BY_EMAIL = """
+SELECT user_id, first_name, last_name, email, password, phone, created_at, isAdmin
+FROM user
+WHERE email = %(email)s
+LIMIT 1;
+"""
+
+# Existence / key-only lookups: no full row fetched or User built
+_Q_EMAIL_EXISTS = "SELECT 1 FROM user WHERE email = %(email)s LIMIT 1;"
+
+_Q_GET_USER_BY_ID = "SELECT * FROM user WHERE user_id = %(user_id)s;"
+
+# Explicitly select columns to exclude password from results.
+# Keyset pagination on (created_at, user_id), served by ix_user_created:
+# each page seeks straight past the last row of the previous one instead of
+# scanning and discarding OFFSET rows. user_id breaks created_at ties.
+_Q_LIST_USERS_FIRST_PAGE = """
+SELECT user_id, first_name, last_name, email, phone, created_at, isAdmin
+FROM user
+ORDER BY created_at DESC, user_id DESC
+LIMIT %(limit)s;
+"""
+
+_Q_LIST_USERS_PAGE = """
+SELECT user_id, first_name, last_name, email, phone, created_at, isAdmin
+FROM user
+WHERE created_at < %(before_created)s
+   OR (created_at = %(before_created)s AND user_id < %(before_id)s)
+ORDER BY created_at DESC, user_id DESC
+LIMIT %(limit)s;
+"""
+
+_Q_UPDATE_PROFILE = """
+UPDATE user
+SET
+    first_name = %(first_name)s,
+    last_name = %(last_name)s,
+    email = %(email)s,
+    phone = %(phone)s
+WHERE user_id = %(user_id)s;
+"""
+
+_Q_UPDATE_PASSWORD = """
+UPDATE user
+SET password = %(password)s
+WHERE user_id = %(user_id)s;
+"""
+
+# Retires any still-open tokens for the account before a new one is issued
+_Q_INVALIDATE_RESET_TOKENS_BY_EMAIL = """
+UPDATE password_reset_token t
+JOIN user u ON u.user_id = t.user_id
+SET t.used_at = UTC_TIMESTAMP()
+WHERE u.email = %(email)s
+  AND t.used_at IS NULL;
+"""
+
+# Resolves the user by email inside the INSERT; zero rows inserted means no
+# such account, without a separate lookup round trip
+_Q_INSERT_RESET_TOKEN = """
+INSERT INTO password_reset_token
+    (user_id, token_hash, expires_at, created_at)
+SELECT user_id, %(token_hash)s,
+       DATE_ADD(UTC_TIMESTAMP(), INTERVAL %(ttl_minutes)s MINUTE), UTC_TIMESTAMP()
+FROM user
+WHERE email = %(email)s
+LIMIT 1;
+"""
+
+_Q_VERIFY_RESET_TOKEN = """
+SELECT t.id as token_id, t.user_id, t.expires_at, t.used_at,
+       u.email, u.password
+FROM password_reset_token t
+JOIN user u ON u.user_id = t.user_id
+WHERE t.token_hash = %(token_hash)s
+  AND (t.used_at IS NULL)
+  AND (t.expires_at > UTC_TIMESTAMP())
+LIMIT 1;
+"""
+
+# Sets the password and consumes the token in one statement. InnoDB row-locks
+# the matched token, so a concurrent reset re-checks used_at after the lock
+# and matches nothing.
+_Q_COMPLETE_RESET = """
+UPDATE user u
+JOIN password_reset_token t ON t.user_id = u.user_id
+SET u.password = %(password)s,
+    t.used_at = UTC_TIMESTAMP()
+WHERE t.token_hash = %(token_hash)s
+  AND t.used_at IS NULL
+  AND t.expires_at > UTC_TIMESTAMP();
+"""
+
+# =============================================================================
+# ROW TYPES - Lightweight read-only rows for list views
+# =============================================================================
+
+def _encode_user_cursor(row):
+    """Build the getAllUsers page cursor for the row a page ended on."""
+    return f"{row.created_at.isoformat(sep=' ')}|{row.user_id}"
+
+
+def _decode_user_cursor(cursor):
+    """
+    Split a getAllUsers cursor into (created_at, user_id).
+    Returns None for a missing or malformed cursor.
+    """
+    if not cursor:
+        return None
+    created_at, _, user_id = cursor.rpartition('|')
+    try:
+        return datetime.fromisoformat(created_at), int(user_id)
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True, frozen=True)
+class UserRow:
+    """
+    Password-free user row returned by User.getAllUsers().
+    Cheaper than a full User and serializable by jsonify as-is. Field order
+    matches the list queries' column order so rows build positionally.
+    """
+    user_id: int
+    first_name: str
+    last_name: str
+    email: str
+    phone: str
+    created_at: datetime
+    isAdmin: int
+
 
 class User:
     """
     Represents a user account in the VoteSmartt system.
     """
-    db = db         # DB identifier for mySQL connection
+    # Fixed attribute set: no per-instance __dict__, smaller objects and
+    # faster attribute access when many users are materialized at once
+    __slots__ = ('user_id', 'first_name', 'last_name', 'email', 'password',
+                 'phone', 'created_at', 'isAdmin', 'is_admin', 'canCastVote')
     
     def __init__(self, data):
         """
         Initialize a User instance from database row data.
         """
-        self.user_id = data['user_id']
-        self.first_name = data['first_name']
-        self.last_name = data['last_name']
-        self.email = data['email']
-        self.password = data['password']
-        self.phone = data['phone']
-        self.created_at = data['created_at']
+        (self.user_id, self.first_name, self.last_name, self.email,
+         self.password, self.phone, self.created_at) = _user_columns(data)
         # Handle isAdmin field safely - convert None to 0, then to int
         # This prevents errors when isAdmin is missing or NULL in DB result
         isAdmin_value = data.get('isAdmin', 0)
         self.isAdmin = int(isAdmin_value) if isAdmin_value is not None else 0
-        
-    # =========================================================================
-    # PROPERTIES - Computed attributes
-    # =========================================================================
 
-    @property
-    def is_admin(self) -> bool:
-        """
-        Check if user has administrator privileges. No super admin registration path in
-        current implementation, but is checked for throughout controllers. Could be a
-        future upgrade.
-        
-        Returns:
-            bool: True if user is admin (isAdmin=1), False if voter (isAdmin=0)
-        """
-        return self.isAdmin == 1
+        # Role flags are fixed for the life of the object, so compute them
+        # once here instead of on every permission check / template guard.
+        # is_admin: administrator privileges (isAdmin=1). No super admin
+        # registration path in current implementation, but is checked for
+        # throughout controllers. Could be a future upgrade.
+        self.is_admin = self.isAdmin == 1
+        # canCastVote: voters may cast votes, admins may not
+        self.canCastVote = not self.is_admin
 
     # =========================================================================
     # ROLE-BASED CAPABILITY METHODS - Permission checks, user level
     # =========================================================================
     
-    def canCastVote(self) -> bool:       
-        """
-        Checks if user is allowed to cast votes. They are not admin.
-        
-        Returns:
-            bool: True if user can vote (is a voter), False if admin
-        """
-        return not self.is_admin
-
     def canManageEvent(self, event) -> bool:
         """
         Check if user can manage a specific event (edit/delete).
@@ -124,14 +278,7 @@ class User:
         Returns:
             int: The user_id of the newly created user, or False on failure
         """
-        query = '''
-        INSERT INTO
-        user
-        (first_name, last_name, email, password, phone, created_at) 
-        VALUES 
-        (%(first_name)s, %(last_name)s, %(email)s, %(password)s, %(phone)s, NOW());
-        '''
-        return connectToMySQL(db).query_db(query, data)
+        return _mysql.query_db(_Q_INSERT_USER, data)
 
     # =========================================================================
     # READ OPERATIONS - User retrieval
@@ -149,13 +296,25 @@ class User:
         Returns:
             User: User object if found, None if no user with that email
         """
-        query = "SELECT * FROM user WHERE email = %(email)s;"
-        
-        result = connectToMySQL(db).query_db(query, data)
+        result = _mysql.query_db(_Q_GET_USER_BY_EMAIL, data)
         if not result:
             return None
         return cls(result[0])
 
+    @classmethod
+    def emailExists(cls, email) -> bool:
+        """
+        Check whether an account already uses this email address.
+        Cheaper than getUserByEmail when only existence matters.
+        
+        Args:
+            email (str): Email address to check
+        
+        Returns:
+            bool: True if a user with that email exists, False otherwise
+        """
+        return bool(_mysql.query_db(_Q_EMAIL_EXISTS, {'email': email}))
+
     @classmethod
     def getUserByID(cls,data):
         """
@@ -168,37 +327,42 @@ class User:
         Returns:
             User: User object if found, None if user doesn't exist or on error
         """
-        query = "SELECT * FROM user WHERE user_id = %(user_id)s;"
-        result = connectToMySQL(db).query_db(query, data)
+        result = _mysql.query_db(_Q_GET_USER_BY_ID, data)
         # Handle both empty results ([]) and database errors (False)
-        if not result or result is False:
-            return None
-        try:
-            return cls(result[0])
-        except Exception:
+        if not result:
             return None
+        return cls(result[0])
     
     @classmethod
-    def getAllUsers(cls):
+    def getAllUsers(cls, limit=50, before=None):
         """
-        Retrieve all users for admin dashboard display.
+        Retrieve one page of users for admin dashboard display, newest first.
    
         Args:
-            None
+            limit (int): Maximum number of users to return (default 50)
+            before (str or None): next_cursor from the previous page; None
+                                  (or an unreadable cursor) starts at the
+                                  newest user
         
         Returns:
-            list[dict]: List of user dictionaries (not User objects)
-                        containing: user_id, first_name, last_name,
-                        email, phone, created_at, isAdmin
-                        Returns empty list or False on error.
+            tuple: (page, next_cursor)
+                   - page (list[UserRow]): Password-free rows containing:
+                     user_id, first_name, last_name, email, phone,
+                     created_at, isAdmin. Empty list on error.
+                   - next_cursor (str or None): Opaque cursor for the next
+                     page, None when this is the last page
         """
-        # Explicitly select columns to exclude password from results
-        query = """
-        SELECT user_id, first_name, last_name, email, phone, created_at, isAdmin
-        FROM user
-        ORDER BY created_at DESC;
-        """
-        return connectToMySQL(db).query_db(query)
+        data = {'limit': int(limit)}
+        position = _decode_user_cursor(before)
+        if position:
+            data['before_created'], data['before_id'] = position
+            page = _mysql.query_db_as(UserRow, _Q_LIST_USERS_PAGE, data)
+        else:
+            page = _mysql.query_db_as(UserRow, _Q_LIST_USERS_FIRST_PAGE, data)
+        if not page:
+            return [], None
+        next_cursor = _encode_user_cursor(page[-1]) if len(page) == data['limit'] else None
+        return page, next_cursor
 
     # =========================================================================
     # UPDATE OPERATIONS - Profile and password management
@@ -220,16 +384,7 @@ class User:
         Returns:
             bool: True if update successful, False otherwise
         """
-        query = """
-        UPDATE user
-        SET 
-            first_name = %(first_name)s, 
-            last_name = %(last_name)s, 
-            email = %(email)s, 
-            phone = %(phone)s 
-        WHERE user_id = %(user_id)s;
-        """
-        return connectToMySQL(db).query_db(query, data)
+        return _mysql.query_db(_Q_UPDATE_PROFILE, data)
     
     @classmethod
     def updatePassword(cls, data):
@@ -244,14 +399,83 @@ class User:
         Returns:
             bool: True if update successful, False otherwise
         """
-        query = """
-        UPDATE user 
-        SET 
-            password = %(password)s 
-        WHERE user_id = %(user_id)s;
+        return _mysql.query_db(_Q_UPDATE_PASSWORD, data)
+
+    # =========================================================================
+    # PASSWORD HASHING - Argon2id with legacy bcrypt fallback
+    # =========================================================================
+
+    @staticmethod
+    def hashPassword(plain):
         """
-        return connectToMySQL(db).query_db(query, data)
-    
+        Hash a plaintext password for storage.
+
+        Args:
+            plain (str): Plaintext password
+
+        Returns:
+            str: Argon2id-encoded hash (fits in VARCHAR(255))
+        """
+        return _password_hasher.hash(plain)
+
+    @staticmethod
+    def verifyPassword(stored, plain) -> bool:
+        """
+        Check a plaintext password against a stored hash.
+        Accepts Argon2id hashes as well as bcrypt hashes written before
+        the switch to Argon2id. Pass stored=None when no user was found;
+        a dummy hash is verified instead so the call takes as long as a
+        real check.
+
+        Args:
+            stored (str | None): Hash from the user.password column
+            plain (str): Plaintext password to check
+
+        Returns:
+            bool: True if the password matches, False otherwise
+        """
+        if not plain:
+            return False
+        if not stored:
+            try:
+                _password_hasher.verify(_DUMMY_HASH, plain)
+            except (VerificationError, InvalidHashError):
+                pass
+            return False
+        if isinstance(stored, bytes):
+            stored = stored.decode()
+        if stored.startswith('$argon2'):
+            try:
+                return _password_hasher.verify(stored, plain)
+            except (VerificationError, InvalidHashError):
+                return False
+        # Legacy bcrypt hash ($2b$...). Imported here so processes that
+        # never see a pre-Argon2 hash don't load the bcrypt extension.
+        import bcrypt
+        try:
+            return bcrypt.checkpw(plain.encode(), stored.encode())
+        except ValueError:
+            return False
+
+    @staticmethod
+    def passwordNeedsRehash(stored) -> bool:
+        """
+        Check whether a stored hash should be replaced on next login, either
+        because it is a legacy bcrypt hash or because the Argon2 parameters
+        have changed since it was written.
+
+        Args:
+            stored (str): Hash from the user.password column
+
+        Returns:
+            bool: True if the hash should be regenerated
+        """
+        if isinstance(stored, bytes):
+            stored = stored.decode()
+        if not stored.startswith('$argon2'):
+            return True
+        return _password_hasher.check_needs_rehash(stored)
+
 
     # =========================================================================
     # PASSWORD RESET TOKEN FLOW - Secure password recovery
@@ -259,14 +483,16 @@ class User:
     # These methods implement a secure token-based password reset flow:
     # 1. User requests reset -> createPasswordResetToken() generates token
     # 2. User clicks email link -> verifyPasswordResetToken() validates
-    # 3. User submits new password -> consumePasswordResetToken() marks used
+    # 3. User submits new password -> completeReset() updates the password
+    #    and consumes the token in one statement
 
     @classmethod
     def createPasswordResetToken(cls, email: str, ttl_minutes: int = 30):
         """
         Generate a one-time password reset token for a user.
         Creates a cryptographically secure token, hashes it with SHA-256,
-        and stores the hash in the database. The raw (unhashed) token is
+        and stores the hash in the database. Any earlier unused tokens for
+        the account are retired first. The raw (unhashed) token is
         returned for inclusion in the reset email link.
         
         Args:
@@ -285,48 +511,68 @@ class User:
             - Only the SHA-256 hash is stored; raw token is not persisted
             - Token expires after ttl_minutes (default 30)
         """
-        # Look up user by email
-        user = cls.getUserByEmail({'email': email})
-        if not user:
-            return True, None   # return success w/o email to avoid leaking email existence
+        # Only the newest link should work
+        _mysql.query_db(_Q_INVALIDATE_RESET_TOKENS_BY_EMAIL, {'email': email})
 
-        # Generate token
-        raw_token = secrets.token_urlsafe(32)
-        # Store the hash - encode to bytes -> encrypt to hash object -> convert to hexadec str
-        token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+        # Generate 192 random bits; hash the bytes themselves and only
+        # base64url-encode the copy that goes into the email link
+        raw_bytes = secrets.token_bytes(24)
+        # Store the raw 32-byte SHA-256 digest (BINARY(32) column, no hex step)
+        token_hash = hashlib.sha256(raw_bytes).digest()
+        raw_token = base64.urlsafe_b64encode(raw_bytes).rstrip(b'=').decode('ascii')
 
-        # Determine experation time
-        expires_at = datetime.utcnow() + timedelta(minutes=ttl_minutes)
-        
-        # Insert token_hash into the db
-        query = (
-            """
-            INSERT INTO password_reset_token
-                (user_id, token_hash, expires_at, created_at)
-            VALUES
-                (%(user_id)s, %(token_hash)s, %(expires_at)s, NOW());
-            """
-        )
+        # Insert token_hash into the db; expiry is computed by MySQL on the
+        # same clock the verify queries compare against (UTC_TIMESTAMP())
         data = {
-            'user_id': user.user_id,
+            'email': email,
             'token_hash': token_hash,
-            'expires_at': expires_at.strftime('%Y-%m-%d %H:%M:%S')
+            'ttl_minutes': int(ttl_minutes)
         }
-        ok = connectToMySQL(db).query_db(query, data)
-        if not ok:
-            # Fail silently (do not reveal user existence)
+        inserted = _mysql.query_db_rowcount(_Q_INSERT_RESET_TOKEN, data)
+        if not inserted:
+            # Unknown email or database error: return success w/o a token so
+            # email existence is not leaked
             return True, None
         return True, raw_token      # Return raw token for email link
 
     @classmethod
-    def verifyPasswordResetToken(cls, raw_token: str):
+    def hashResetToken(cls, raw_token):
+        """
+        Hash a reset token from an emailed link into the digest stored in
+        password_reset_token.token_hash. Callers that run several reset
+        steps can hash once and pass the digest to each of them.
+
+        Args:
+            raw_token (str): Base64url token from the reset URL
+
+        Returns:
+            bytes: 32-byte SHA-256 digest of the token's random bytes,
+                   or None if the token is not valid base64url
+        """
+        try:
+            raw_bytes = base64.urlsafe_b64decode(raw_token + '=' * (-len(raw_token) % 4))
+        except (binascii.Error, ValueError):
+            return None
+        return hashlib.sha256(raw_bytes).digest()
+
+    @classmethod
+    def _token_digest(cls, token):
+        """
+        Accept either a raw token (str) or an already computed digest (bytes)
+        so a caller handling several steps of one reset only hashes once.
+        """
+        return token if isinstance(token, bytes) else cls.hashResetToken(token)
+
+    @classmethod
+    def verifyPasswordResetToken(cls, raw_token):
         """
         Validate a password reset token and return associated user info.
         Hashes the provided token and looks up the matching record.
         Only returns valid tokens that are unused and not expired.
         
         Args:
-            raw_token (str): The token string from the reset URL
+            raw_token (str | bytes): The token string from the reset URL, or
+                                     its digest from User.hashResetToken()
         
         Returns:
             dict: Token and user information if valid:
@@ -341,48 +587,40 @@ class User:
         if not raw_token:
             return None
         
-        # Hash the token in the same process to match against the stored hash
-        token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+        token_hash = cls._token_digest(raw_token)
+        if token_hash is None:
+            return None
         # Look up the token, to ensure its unused + not expired
-        query = (
-            """
-            SELECT t.id as token_id, t.user_id, t.expires_at, t.used_at,
-                   u.email, u.password
-            FROM password_reset_token t
-            JOIN user u ON u.user_id = t.user_id
-            WHERE t.token_hash = %(token_hash)s
-              AND (t.used_at IS NULL)
-              AND (t.expires_at > NOW());
-            """
-        )
-        rows = connectToMySQL(db).query_db(query, {'token_hash': token_hash})
+        rows = _mysql.query_db(_Q_VERIFY_RESET_TOKEN, {'token_hash': token_hash})
         if not rows:
             return None
         return rows[0]
 
     @classmethod
-    def consumePasswordResetToken(cls, raw_token: str):
+    def completeReset(cls, raw_token, new_password_hash):
         """
-        Mark a password reset token as used (consumed).
-        Should be called after successfully updating the user's password
-        to prevent token reuse. Sets used_at timestamp to current time.
+        Finish a password reset with a single joined UPDATE.
+        Writes the new password and marks the token used in one statement
+        (one round trip, atomic), so a token can't be consumed twice by
+        concurrent requests.
         
         Args:
-            raw_token (str): The token string that was used
+            raw_token (str | bytes): The token string from the reset form, or
+                                     its digest from User.hashResetToken()
+            new_password_hash (str): New pre-hashed password
         
         Returns:
-            bool: True if token was marked as used, False otherwise
+            bool: True if the password was updated, False if the token is
+                  invalid, expired, already used, or on database error
         """
         if not raw_token:
             return False
-        # Hash token to match the stored value
-        token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
-        # Mark token as used to prevent reuse
-        query = (
-            """
-            UPDATE password_reset_token
-            SET used_at = NOW()
-            WHERE token_hash = %(token_hash)s AND used_at IS NULL;
-            """
-        )
-        return bool(connectToMySQL(db).query_db(query, {'token_hash': token_hash}))
+        token_hash = cls._token_digest(raw_token)
+        if token_hash is None:
+            return False
+        data = {
+            'token_hash': token_hash,
+            'password': new_password_hash
+        }
+        # No matched rows means the token was invalid, expired or already used
+        return bool(_mysql.query_db_rowcount(_Q_COMPLETE_RESET, data))
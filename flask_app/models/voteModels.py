@@ -13,24 +13,131 @@ Columns:
     - voted_at (datetime): Timestamp when vote was cast/updated
     - vote_user_id (int): Foreign key to user.user_id
     - vote_option_id (int): Foreign key to option.option_id
+    - vote_event_id (int): Foreign key to event.event_id (copied from the
+      option so one-vote-per-event can be a unique key)
 
 Class Relationships:
     - Vote *--1 User: Many votes can be cast by one user (across events)
     - Vote *--1 Option: Many votes can select one option
-    - Vote *--1 Event: Indirectly through Option (option_event_id)
+    - Vote *--1 Event: Directly via vote_event_id (fk_vote_event), which
+      always matches the option's option_event_id
 
 VoteSmartt Rules:
-    - Each user can cast only ONE vote per event (enforced via getByUserAndEvent)
+    - Each user can cast only ONE vote per event (unique key on
+      vote_user_id, vote_event_id; see upsertVote)
     - Votes can only be cast/changed/deleted when event status is 'Open'
     - Admins (isAdmin=1) cannot cast votes (if super admin implemented in future)
     - Event creators cannot vote on their own events
     - Votes are timestamped with voted_at updated on each change
 '''
 
-from flask_app.models.eventsModels import Events, compute_status
+from flask_app.models.eventsModels import Events, compute_status, get_now_pacific
 from flask_app.config.mysqlconnection import connectToMySQL
+from flask_app.utils.cache import TTLCache
+from collections import namedtuple
 
 db = "mydb"
+_mysql = connectToMySQL(db)     # Cached connector, resolved once at import
+
+# Lightweight record for Vote.getRecentForUser (dashboard "recent votes")
+VoteRow = namedtuple('VoteRow', 'vote_id event_name date status vote_type event_id')
+
+# event_id -> tally rows. Results pages re-read the same aggregate many times
+# a second on busy events; every vote write through this model drops the
+# event's entry, and the short TTL bounds staleness from anything else.
+_tally_cache = TTLCache(maxsize=512, ttl=2)
+
+# user_id -> dashboard stats dict. Vote writes drop the user's entry; the
+# TTL bounds how long "available events" lags behind events closing.
+_stats_cache = TTLCache(maxsize=2048, ttl=30)
+
+# =============================================================================
+# SQL STATEMENTS - Built once at import and shared by every call
+# =============================================================================
+
+# Guards are part of the statement, so nothing can change between check and
+# write: the option must belong to the event, the event must be Open (same
+# rules as compute_status, against the Pacific-time %(now)s) and the voter
+# must not be its creator. A failed guard inserts nothing (0 rows)
+_Q_UPSERT_VOTE = """
+INSERT INTO vote (voted_at, vote_user_id, vote_option_id, vote_event_id)
+SELECT NOW(), %(user_id)s, o.option_id, o.option_event_id
+FROM `option` o
+JOIN event e ON e.event_id = o.option_event_id
+WHERE o.option_id = %(option_id)s AND o.option_event_id = %(event_id)s
+  AND (e.start_time IS NOT NULL OR e.end_time IS NOT NULL)
+  AND (e.start_time IS NULL OR %(now)s >= e.start_time)
+  AND (e.end_time IS NULL OR %(now)s < e.end_time)
+  AND e.created_byFK != %(user_id)s
+ON DUPLICATE KEY UPDATE
+    vote_option_id = VALUES(vote_option_id),
+    voted_at = NOW();
+"""
+
+_Q_GET_BY_ID = "SELECT * FROM vote WHERE vote_id = %(vote_id)s;"
+
+# Single-table lookup on the (vote_user_id, vote_event_id) unique key
+_Q_SELECTED_OPTION = """
+SELECT vote_option_id FROM vote
+WHERE vote_user_id = %(user_id)s
+AND vote_event_id = %(event_id)s;
+"""
+
+# Status uses the same rules as compute_status, against the app's
+# Pacific-time clock, lowercased for the dashboard. Columns are aliased and
+# ordered to match VoteRow, so rows are built straight off a tuple cursor
+_Q_RECENT_FOR_USER = """
+SELECT
+    v.vote_id,
+    e.title AS event_name,
+    v.voted_at AS date,
+    CASE
+        WHEN e.start_time IS NULL AND e.end_time IS NULL THEN 'unknown'
+        WHEN %(now)s < e.start_time THEN 'waiting'
+        WHEN %(now)s >= e.end_time THEN 'closed'
+        ELSE 'open'
+    END AS status,
+    o.option_text AS vote_type,
+    e.event_id
+FROM vote v
+JOIN `option` o ON o.option_id = v.vote_option_id
+JOIN event e ON e.event_id = v.vote_event_id
+WHERE v.vote_user_id = %(user_id)s
+ORDER BY v.voted_at DESC
+LIMIT %(limit)s;
+"""
+
+_Q_DELETE_VOTE = """
+DELETE FROM vote
+WHERE vote_user_id = %(user_id)s
+  AND vote_event_id = %(event_id)s;
+"""
+
+_Q_TALLY_FOR_EVENT = """
+SELECT o.option_id, o.option_text, COUNT(v.vote_id) AS votes
+FROM `option` o
+LEFT JOIN vote v
+ON v.vote_option_id = o.option_id
+WHERE o.option_event_id = %(event_id)s
+GROUP BY o.option_id, o.option_text
+ORDER BY votes DESC, o.option_text ASC;
+"""
+
+# vote_event_id is unique per user, so the vote count is also the count of
+# distinct events; vote_user_id/voted_at come straight from ix_vote_user_voted
+_Q_STATS_FOR_USER = """
+SELECT
+    COUNT(*) AS total_votes,
+    MAX(voted_at) AS last_vote_date,
+    COUNT(*) AS events_participated,
+    (SELECT COUNT(*)
+     FROM event
+     WHERE end_time < %(now)s
+       AND created_byFK != %(user_id)s) AS total_available
+FROM vote
+WHERE vote_user_id = %(user_id)s;
+"""
+
 
 class Vote:
     """
@@ -38,6 +145,9 @@ class Vote:
     Attributes correspond to the 'vote' database table.
     """
     db = db         # DB identifier for mySQL connection
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ('vote_id', 'voted_at', 'vote_user_id', 'vote_option_id',
+                 'vote_event_id')
 
     def __init__(self, data):
         """
@@ -47,29 +157,37 @@ class Vote:
         self.voted_at = data['voted_at']
         self.vote_user_id = data['vote_user_id']
         self.vote_option_id = data['vote_option_id']
+        self.vote_event_id = data['vote_event_id']
 
     # =========================================================================
-    # CREATE OPERATIONS - Cast new votes
+    # CREATE/UPDATE OPERATIONS - Cast or change votes
     # =========================================================================
 
     @classmethod
-    def castVote(cls, data):
+    def upsertVote(cls, data):
         """
-        Inserts a new vote record for a user selecting an option.
-        
+        Cast a vote, or change the user's existing vote in the same event,
+        in one statement. The unique key on (vote_user_id, vote_event_id)
+        turns a second vote into an update of the first, and the open-event,
+        creator and option checks are re-applied inside the INSERT, so there
+        is no race between check and write.
+
         Args:
             data (dict): Dictionary containing:
-                         - 'vote_user_id' (int): ID of user casting vote
-                         - 'vote_option_id' (int): ID of selected option
-        
+                         - 'user_id' (int): ID of user voting
+                         - 'event_id' (int): ID of event being voted on
+                         - 'option_id' (int): ID of selected option
+
         Returns:
-            int: The vote_id of the newly created vote, or False on failure.
+            int: Affected rows (1 = new vote, 2 = existing vote changed,
+                 0 = blocked: option not in this event, event not open,
+                 or voter created the event; also 0 if the same option is
+                 re-submitted within the same second), or False on failure.
         """
-        query = '''
-        INSERT INTO vote (voted_at, vote_user_id, vote_option_id)
-        VALUES (NOW(), %(vote_user_id)s, %(vote_option_id)s);
-        '''
-        return connectToMySQL(db).query_db(query, data)
+        result = _mysql.query_db_rowcount(_Q_UPSERT_VOTE, {**data, 'now': get_now_pacific()})
+        _tally_cache.pop(int(data['event_id']))
+        _stats_cache.pop(int(data['user_id']))
+        return result
 
     # =========================================================================
     # READ OPERATIONS - Retrieve vote records
@@ -87,37 +205,27 @@ class Vote:
         Returns:
             Vote: Vote object if found, None otherwise.
         """
-        query = "SELECT * FROM vote WHERE vote_id = %(vote_id)s;"
-        result = connectToMySQL(db).query_db(query, data)
+        result = _mysql.query_db(_Q_GET_BY_ID, data)
         return cls(result[0]) if result else None
     
     @classmethod
-    def getByUserAndEvent(cls, data):
+    def getSelectedOptionID(cls, data):
         """
-        Retrieve a user's vote for a specific event.
-        
-        This is the primary method for enforcing the one-vote-per-user-per-event
-        rule. Since votes link to options (not directly to events), this method
-        joins through the option table to find votes by event.
-        
+        Get only the option a user picked in an event, for pre-selecting
+        it on the event page. Reads a single column and builds no Vote.
+
         Args:
             data (dict): Dictionary containing:
                          - 'user_id' (int): ID of the user
                          - 'event_id' (int): ID of the event
-        
+
         Returns:
-            Vote: Vote object if user has voted in event, None otherwise.
+            int: The voted option_id, or None if the user has not voted
+                 (or on error).
         """
-        query = """
-        SELECT v.* FROM vote v
-        JOIN `option` o ON o.option_id = v.vote_option_id
-        WHERE v.vote_user_id = %(user_id)s
-        AND o.option_event_id = %(event_id)s
-        LIMIT 1;
-        """
-        result = connectToMySQL(db).query_db(query, data)
-        return cls(result[0]) if result else None
-    
+        option_id = _mysql.query_scalar(_Q_SELECTED_OPTION, data)
+        return None if option_id is False else option_id
+
     @classmethod  
     def getRecentForUser(cls, data):
         """
@@ -130,83 +238,24 @@ class Vote:
                          - 'limit' (int): Maximum number of votes to return
         
         Returns:
-            list[dict]: List of vote records, each containing:
-                        - 'vote_id' (int): Vote's ID
-                        - 'event_name' (str): Title of the event
-                        - 'date' (datetime): When vote was cast
-                        - 'status' (str): Event status (lowercase)
-                        - 'vote_type' (str): Selected option text
-                        - 'event_id' (int): Event's ID for linking
+            list[VoteRow]: List of vote records, each with fields:
+                        - vote_id (int): Vote's ID
+                        - event_name (str): Title of the event
+                        - date (datetime): When vote was cast
+                        - status (str): Event status (lowercase)
+                        - vote_type (str): Selected option text
+                        - event_id (int): Event's ID for linking
                         Returns empty list if user has no votes.
         """
-        query = """
-        SELECT 
-            v.vote_id,
-            v.voted_at,
-            e.event_id,
-            e.title as event_name,
-            e.start_time,
-            e.end_time,
-            o.option_text
-        FROM vote v
-        JOIN `option` o ON o.option_id = v.vote_option_id
-        JOIN event e ON e.event_id = o.option_event_id
-        WHERE v.vote_user_id = %(user_id)s
-        ORDER BY v.voted_at DESC
-        LIMIT %(limit)s;
-        """
-        result = connectToMySQL(db).query_db(query, data)
-        
-        if not result:
-            return []
-        
-        # Transform results into desired format
-        votes = []
-        for row in result:
-            # Determine event status
-            status = compute_status(row['start_time'], row['end_time'])
-            # Build vote record formatted for dashboard
-            votes.append({
-                'vote_id': row['vote_id'],
-                'event_name': row['event_name'],
-                'date': row['voted_at'],
-                'status': status.lower(),
-                'vote_type': row['option_text'],
-                'event_id': row['event_id']
-            })
-        
-        return votes
+        # Status comes back computed in SQL. The driver renders an int
+        # parameter as a bare literal, which LIMIT accepts
+        result = _mysql.query_db_as(VoteRow, _Q_RECENT_FOR_USER, {
+            'user_id': data['user_id'],
+            'now': get_now_pacific(),
+            'limit': max(int(data['limit']), 1),
+        })
+        return result or []
 
-    # =========================================================================
-    # UPDATE OPERATIONS - Modify existing votes
-    # =========================================================================
-
-    @classmethod
-    def changeVote(cls, data):
-        """
-        Update a user's existing vote to a different option.
-        
-        Finds the user's vote within the specified event and updates the
-        selected option. Also updates voted_at to the current timestamp.
-        
-        Args:
-            data (dict): Dictionary containing:
-                         - 'user_id' (int): ID of user changing vote
-                         - 'event_id' (int): ID of event containing vote
-                         - 'new_option_id' (int): ID of new option selection
-        
-        Returns:
-            bool: True if update successful, False otherwise.
-        """
-        query = """
-        UPDATE vote v
-        JOIN `option` o ON o.option_id = v.vote_option_id
-        SET v.vote_option_id = %(new_option_id)s, v.voted_at = NOW()
-        WHERE v.vote_user_id = %(user_id)s
-        AND o.option_event_id = %(event_id)s;
-        """
-        return connectToMySQL(db).query_db(query, data)
-    
     # =========================================================================
     # DELETE OPERATIONS - Remove/retract votes
     # =========================================================================
@@ -217,8 +266,8 @@ class Vote:
         Delete (retract) a user's vote from an event.
         
         Allows users to completely remove their vote while an event is
-        still open. Uses JOIN to ensure only the vote for the specified
-        event is deleted.
+        still open. Filters on vote_event_id so only the vote for the
+        specified event is deleted.
         
         Args:
             data (dict): Dictionary containing:
@@ -228,13 +277,10 @@ class Vote:
         Returns:
             bool: True if deletion successful, False otherwise.
         """
-        query = """
-        DELETE v FROM vote v
-        JOIN `option` o ON o.option_id = v.vote_option_id
-        WHERE v.vote_user_id = %(user_id)s
-          AND o.option_event_id = %(event_id)s;
-        """
-        return connectToMySQL(db).query_db(query, data)
+        result = _mysql.query_db(_Q_DELETE_VOTE, data)
+        _tally_cache.pop(int(data['event_id']))
+        _stats_cache.pop(int(data['user_id']))
+        return result
     
     # =========================================================================
     # AGGREGATION OPERATIONS - Vote counting and statistics
@@ -246,7 +292,8 @@ class Vote:
         Counts votes for each option in an event.
         Returns all options for the event with their vote counts, sorted
         by votes descending. Used by the Result model to calculate
-        percentages and determine winners.
+        percentages and determine winners. Served from a 2-second cache
+        that vote writes invalidate.
         
         Args:
             data (dict): Dictionary containing:
@@ -258,17 +305,17 @@ class Vote:
                         - 'option_text' (str): Option's display text
                         - 'votes' (int): Number of votes received
                         Results sorted by votes DESC, then option_text ASC.
+                        Returns False on database error.
         """
-        query = """
-        SELECT o.option_id, o.option_text, COUNT(v.vote_id) AS votes
-        FROM `option` o
-        LEFT JOIN vote v
-        ON v.vote_option_id = o.option_id
-        WHERE o.option_event_id = %(event_id)s
-        GROUP BY o.option_id, o.option_text
-        ORDER BY votes DESC, o.option_text ASC;
-        """
-        return connectToMySQL(db).query_db(query, data)
+        event_id = int(data['event_id'])
+        rows = _tally_cache.get(event_id)
+        if rows is None:
+            rows = _mysql.query_db(_Q_TALLY_FOR_EVENT, data)
+            if rows is False:
+                return False
+            _tally_cache.set(event_id, rows)
+        # Callers (Result.calculate) annotate rows in place; hand out copies
+        return [dict(row) for row in rows]
     
     @classmethod
     def getStatsForUser(cls, data):
@@ -288,22 +335,24 @@ class Vote:
                     events user has participated in (0.0-100.0)
                   - 'events_participated' (int): Count of unique events
                   - 'last_vote_date' (str): Formatted date or 'Never'
+            Served from a 30-second per-user cache that vote writes invalidate.
         """
-        user_id = data['user_id']
-        
-        # Query 1: Get total votes and last vote date in one query
+        user_id = int(data['user_id'])
+        cached = _stats_cache.get(user_id)
+        if cached is not None:
+            return dict(cached)
+
+        # One round trip: vote count, last vote and distinct events come from
+        # a single pass over the user's votes; the available-events count is
+        # a scalar subquery.
+        # Only CLOSED events count as available (end_time passed, compared in
+        # Pacific time like compute_status), excluding events the user
+        # created (creators cannot vote on their own events).
         # COUNT(*) returns 0 (not NULL) if no votes, MAX returns NULL if no votes
-        query_votes = """
-        SELECT 
-            COUNT(*) as total_votes,
-            MAX(voted_at) as last_vote_date
-        FROM vote
-        WHERE vote_user_id = %(user_id)s;
-        """
-        result_votes = connectToMySQL(db).query_db(query_votes, {'user_id': user_id})
+        result = _mysql.query_db(_Q_STATS_FOR_USER, {'user_id': user_id, 'now': get_now_pacific()})
         
-        # Handle empty results safely
-        if not result_votes or result_votes is False:
+        # Handle empty results / database errors safely
+        if not result:
             return {
                 'total_votes': 0,
                 'participation_rate': 0.0,
@@ -312,40 +361,11 @@ class Vote:
             }
         
         # Extract values with fallback to 0/None if NULL returned
-        total_votes = result_votes[0]['total_votes'] or 0
-        last_vote_date = result_votes[0]['last_vote_date'] # will be None if no votes
-        
-        # Query 2: Count unique events user has participated in
-        # Must JOIN through option table b/c votes link to options, not events directly
-        # DISTINCT ensures we count events, not individual votes (user votes once per event)
-        query_events = """
-        SELECT COUNT(DISTINCT o.option_event_id) as events_participated
-        FROM vote v
-        JOIN `option` o ON o.option_id = v.vote_option_id
-        WHERE v.vote_user_id = %(user_id)s;
-        """
-        result_events = connectToMySQL(db).query_db(query_events, {'user_id': user_id})
-        
-        # Safely extract count with default to 0 if query fails or returns NULL
-        events_participated = 0
-        if result_events and len(result_events) > 0:
-            events_participated = result_events[0].get('events_participated', 0) or 0
-        
-        # Query 3: Calculate participation rate
-        # Only count CLOSED events (end_time < NOW) since open events are still in progress
-        # Exclude events created by this user (creators cannot vote on own events)
-        query_available = """
-        SELECT COUNT(*) as total_available
-        FROM event
-        WHERE end_time < NOW() 
-        AND created_byFK != %(user_id)s;
-        """
-        result_available = connectToMySQL(db).query_db(query_available, {'user_id': user_id})
-        
-        # Safely extract count, defaulting to 0 if query fails or returns NULL
-        total_available = 0
-        if result_available and len(result_available) > 0:
-            total_available = result_available[0].get('total_available', 0) or 0
+        row = result[0]
+        total_votes = row['total_votes'] or 0
+        last_vote_date = row['last_vote_date'] # will be None if no votes
+        events_participated = row['events_participated'] or 0
+        total_available = row['total_available'] or 0
         
         # Calculate participation rate, avoiding division by zero
         if total_available > 0:
@@ -353,26 +373,21 @@ class Vote:
         else:
             participation_rate = 0.0
         
-        # Format last vote date
+        # Format last vote date as 'MMM DD, YYYY'. voted_at is a DATETIME
+        # column, which the driver always decodes to a datetime
         if last_vote_date:
-            # Handle string vs datetime object
-            if isinstance(last_vote_date, str):
-                try:
-                    from datetime import datetime
-                    last_vote_date = datetime.strptime(last_vote_date, '%Y-%m-%d %H:%M:%S')
-                except:
-                    pass    # retain as string if parsing fails
-            # Format as 'MMM DD, YYYY' if datetime object, otherwise use string directly
-            last_vote_display = last_vote_date.strftime('%b %d, %Y') if hasattr(last_vote_date, 'strftime') else str(last_vote_date)
+            last_vote_display = last_vote_date.strftime('%b %d, %Y')
         else:
             last_vote_display = 'Never' # User has never voted
         
-        return {
+        stats = {
             'total_votes': total_votes,
             'participation_rate': participation_rate,
             'events_participated': events_participated,
             'last_vote_date': last_vote_display
         }
+        _stats_cache.set(user_id, stats)
+        return dict(stats)
     
     # =========================================================================
     # UTILITY METHODS - Helper functions for vote operations
@@ -0,0 +1,62 @@
+"""
+Small in-process caches shared across request threads.
+
+Entries live only in the current worker process and expire on their own,
+so callers should only cache data where being a few seconds stale is fine
+(aggregate counts, tallies), and pop() keys they know have changed.
+"""
+
+import threading
+from time import monotonic
+
+
+class TTLCache:
+    """
+    Thread-safe key/value cache whose entries expire `ttl` seconds after
+    they are stored. Holds at most `maxsize` entries; when full, expired
+    entries are purged first and then the oldest remaining entry is evicted.
+    """
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}     # key -> (expires_at, value), oldest first
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default if missing/expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= monotonic():
+                del self._data[key]
+                return default
+            return entry[1]
+
+    def set(self, key, value):
+        """Store value under key for the next `ttl` seconds."""
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                self._evict()
+            self._data[key] = (monotonic() + self.ttl, value)
+
+    def pop(self, key, default=None):
+        """Remove key (e.g. after the underlying data changed)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def _evict(self):
+        # Caller holds the lock
+        now = monotonic()
+        for key in [k for k, (expires_at, _) in self._data.items() if expires_at <= now]:
+            del self._data[key]
+        if len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
@@ -2,7 +2,7 @@
 Shared helper functions for authentication and session management.
 """
 
-from flask import session, redirect, flash
+from flask import session, redirect, flash, g
 from flask_app.models.userModels import User
 
 # ============================================================================
@@ -24,8 +24,9 @@ def require_login(redirect_to="/unauthorized"):
             flash("Should you really be here? Please sign in to continue.")
         return redirect_to
     
-    user_id = session["user_id"]
-    user = User.getUserByID({"user_id": user_id})
+    # Loads (and caches on g) the row the route and templates will use next,
+    # so validating the session costs no extra query
+    user = get_current_user()
     if not user:
         session.clear()
         flash("Session expired. Please log in again.")
@@ -37,6 +38,8 @@ def require_login(redirect_to="/unauthorized"):
 def get_current_user():
     """
     Get the currently logged-in user from session.
+    The row is fetched once per request and kept on flask.g, so
+    require_login, the route and get_user_session_data share one lookup.
     
     Returns:
         User object if logged in, None otherwise
@@ -45,7 +48,11 @@ def get_current_user():
     if not user_id:
         return None
     
-    return User.getUserByID({'user_id': user_id})
+    # Keyed by user_id so a login/logout mid-request never sees a stale user
+    cached = g.get('current_user')
+    if cached is None or cached[0] != user_id:
+        cached = g.current_user = (user_id, User.getUserByID({'user_id': user_id}))
+    return cached[1]
 
 
 def require_voter():
@@ -57,8 +64,9 @@ def require_voter():
         True if user is admin (should be blocked from voting)
         False if user is voter (allowed to vote)
     """
+    # Callers run require_login() first, so this reuses the user it loaded
     user = get_current_user()
-    if not user or not user.canCastVote():
+    if not user or user.is_admin:
         flash("Administrators cannot vote on events.", "error")
         return True
     return False
@@ -10,9 +10,46 @@ All validation logic should go through this module to ensure:
 """
 
 import re
-
-# Email validation regex
-EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9.+_-]+@[a-zA-Z0-9._-]+\.[a-zA-Z]+$')
+import string
+
+try:
+    # Optional DFA-based engine (google-re2): linear-time matching, so a
+    # crafted address cannot trigger catastrophic backtracking
+    import re2 as _email_re
+except ImportError:
+    _email_re = re
+
+# Email validation regex, used with fullmatch (anchors implied). Bounded
+# quantifiers cap how much the engine can backtrack on hostile input.
+EMAIL_REGEX = _email_re.compile(r'[a-zA-Z0-9.+_-]{1,64}@[a-zA-Z0-9._-]{1,255}\.[a-zA-Z]{2,24}')
+
+# Phone stripping: ASCII input (the normal case) has every non-digit byte
+# deleted by bytes.translate in one C pass; the regex handles the rest
+_ASCII_NON_DIGITS = bytes(i for i in range(128) if chr(i) not in string.digits)
+_NON_DIGIT_REGEX = re.compile(r'\D')
+
+_PW_SPECIAL_CHARS = '!@#$%^&*(),.?":{}|<>'
+
+# Valid-password fast path: one C-level match checks all four classes.
+# Each lookahead skips with a negated class, so it scans linearly with no
+# backtracking
+_PW_SPECIAL_SET = re.escape(_PW_SPECIAL_CHARS)
+_PW_CHECK = re.compile(
+    r'(?=[^A-Z]*[A-Z])(?=[^a-z]*[a-z])(?=\D*\d)'
+    rf'(?=[^{_PW_SPECIAL_SET}]*[{_PW_SPECIAL_SET}])'
+)
+
+# Password character classes as bit flags, so one dict lookup per character
+# classifies it and a single int tracks which classes have been seen.
+# Only used to pick the error message once _PW_CHECK has failed. Digits
+# follow \d, so non-ASCII decimal digits fall back to str.isdecimal()
+_PW_UPPER, _PW_LOWER, _PW_DIGIT, _PW_SPECIAL = 1, 2, 4, 8
+_PW_CLASS_BITS = {
+    **dict.fromkeys(string.ascii_uppercase, _PW_UPPER),
+    **dict.fromkeys(string.ascii_lowercase, _PW_LOWER),
+    **dict.fromkeys(string.digits, _PW_DIGIT),
+    **dict.fromkeys(_PW_SPECIAL_CHARS, _PW_SPECIAL),
+}
 
 # ================================
 # User Registration methods
@@ -48,7 +85,8 @@ def validate_email(email):
     
     if len(email) > 45:
         return "Email is too long (maximum 45 characters)"
-    if not EMAIL_REGEX.match(email):
+    # Cheap pre-check before running the regex
+    if '@' not in email or not EMAIL_REGEX.fullmatch(email):
         return "Please enter a valid email address"
     
     return None
@@ -71,21 +109,37 @@ def validate_password(password):
     if len(password) < 8:
         return "Password must be at least 8 characters"
     
-    if not re.search(r"[A-Z]", password):
+    if _PW_CHECK.match(password):
+        return None
+
+    # Slow path: one scan ORs each character's class bit to find what's missing
+    seen = 0
+    class_bit = _PW_CLASS_BITS.get
+    for ch in password:
+        seen |= class_bit(ch, 0) or (_PW_DIGIT if ch.isdecimal() else 0)
+
+    if not seen & _PW_UPPER:
         return "Password must contain at least one uppercase letter"
     
-    if not re.search(r"[a-z]", password):
+    if not seen & _PW_LOWER:
         return "Password must contain at least one lowercase letter"
     
-    if not re.search(r"\d", password):
+    if not seen & _PW_DIGIT:
         return "Password must contain at least one number"
     
-    if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
+    if not seen & _PW_SPECIAL:
         return "Password must contain at least one special character"
     
     return None
 
 
+def _strip_non_digits(phone):
+    """Return only the digits of phone (same result as re.sub(r'\\D', '', phone))."""
+    if phone.isascii():
+        return phone.encode('ascii').translate(None, _ASCII_NON_DIGITS).decode('ascii')
+    return _NON_DIGIT_REGEX.sub('', phone)
+
+
 def validate_phone(phone):
     """
     Validate phone number (US format).
@@ -96,7 +150,7 @@ def validate_phone(phone):
         return "Phone number is required"
     
     # Remove all non-digit characters
-    phone_digits = re.sub(r'\D', '', phone)
+    phone_digits = _strip_non_digits(phone)
     
     if len(phone_digits) != 10:
         return "Phone number must be 10 digits"
@@ -112,7 +166,7 @@ def format_phone(phone):
         return ""
     
     # Remove all non-digit characters
-    phone_digits = re.sub(r'\D', '', phone)
+    phone_digits = _strip_non_digits(phone)
     
     if len(phone_digits) == 10:
         return f"({phone_digits[:3]}) {phone_digits[3:6]}-{phone_digits[6:]}"
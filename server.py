@@ -16,7 +16,9 @@ except Exception:
 
 
 def get_port_from_env(default: int = 5000) -> int:
-    port_env = os.environ.get('PORT') or os.environ.get('FLASK_RUN_PORT')
+    # VS_PORT is set by __main__ once a port is chosen, so the reloader's
+    # child process keeps the same port instead of probing for a new one
+    port_env = os.environ.get('PORT') or os.environ.get('FLASK_RUN_PORT') or os.environ.get('VS_PORT')
     if port_env:
         try:
             return int(port_env)
@@ -49,6 +51,7 @@ if __name__ == '__main__':
 
     host = os.environ.get('HOST', '127.0.0.1')
     port = get_port_from_env(5000)
+    os.environ['VS_PORT'] = str(port)
     if not app.config.get('BASE_URL'):
         scheme = os.environ.get('BASE_URL_SCHEME', 'http')
         public_host = _public_host_for_url(host)